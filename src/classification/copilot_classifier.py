@@ -7,9 +7,11 @@ into the 8 predefined categories with relevance scores.
 
 from typing import Dict, List, Any
 import asyncio
-import json
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
+
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,39 @@ class CopilotClassifier:
     def __init__(self, config):
         self.config = config
         self.categories = config.categories
-        # Copilot client would be initialized here
+        # Categories are fixed for the classifier's lifetime, so the prompt
+        # preamble is built once and only article fields are filled per call
+        self._categories_text = "\n".join(
+            f"{i+1}. {cat.name} - {cat.description}"
+            for i, cat in enumerate(self.categories.values())
+        )
+        escaped_categories = self._categories_text.replace("{", "{{").replace("}", "}}")
+        self._prompt_template = (
+            """
+        Analyze this developer blog article and score its relevance to each category (0-100%):
+        
+        Title: {title}
+        Content: {content}...
+        
+        Categories:
+        """ + escaped_categories + """
+        
+        Provide scores as JSON: {{"category_id": score, ...}}
+        Only include categories with scores > 10%.
+        """
+        )
+        # Bound concurrent Copilot requests to the configured rate limit
+        self._sem = asyncio.Semaphore(config.app_config['copilot']['rate_limit'])
+        # A single HTTP/2 connection multiplexes all in-flight classification requests
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+            timeout=config.app_config['copilot']['timeout']
+        )
+    
+    async def aclose(self):
+        """Close the Copilot HTTP client."""
+        await self.client.aclose()
         
     async def classify_article(self, article: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -55,43 +89,47 @@ class CopilotClassifier:
         Returns:
             List of articles with added classification scores
         """
+        async def _classify_one(article: Dict[str, Any]) -> Dict[str, float]:
+            async with self._sem:
+                return await self.classify_article(article)
+        
+        results = await asyncio.gather(
+            *(_classify_one(article) for article in articles),
+            return_exceptions=True
+        )
+        
+        # One timestamp for the whole batch; per-article precision adds nothing
+        timestamp = datetime.now(timezone.utc).isoformat()
         classified_articles = []
         
-        for article in articles:
-            try:
-                scores = await self.classify_article(article)
-                article['category_scores'] = scores
-                article['classification_timestamp'] = datetime.now().isoformat()
-                classified_articles.append(article)
-                
-            except Exception as e:
-                logger.error(f"Classification failed for article {article.get('id', 'unknown')}: {e}")
+        for article, result in zip(articles, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Classification failed for article {article.get('id', 'unknown')}: {result}")
                 # Add default/fallback classification
                 article['category_scores'] = self._get_fallback_classification()
-                article['classification_error'] = str(e)
-                classified_articles.append(article)
+                article['classification_error'] = str(result)
+            else:
+                article['category_scores'] = result
+                article['classification_timestamp'] = timestamp
+            classified_articles.append(article)
         
         return classified_articles
     
     def _build_classification_prompt(self, article: Dict[str, Any]) -> str:
         """Build the prompt for Copilot classification."""
-        categories_text = "\n".join([
-            f"{i+1}. {cat.name} - {cat.description}"
-            for i, cat in enumerate(self.categories.values())
-        ])
-        
-        return f"""
-        Analyze this developer blog article and score its relevance to each category (0-100%):
-        
-        Title: {article['title']}
-        Content: {article['content'][:2000]}...
-        
-        Categories:
-        {categories_text}
-        
-        Provide scores as JSON: {{"category_id": score, ...}}
-        Only include categories with scores > 10%.
-        """
+        return self._prompt_template.format_map({
+            'title': article['title'],
+            'content': article['content'][:2000]
+        })
+    
+    def _parse_classification_response(self, response_text: str) -> Dict[str, float]:
+        """Parse Copilot's JSON score payload into category scores."""
+        data = orjson.loads(response_text)
+        return {
+            category_id: float(score)
+            for category_id, score in data.items()
+            if category_id in self.categories
+        }
     
     def _get_fallback_classification(self) -> Dict[str, float]:
         """Provide fallback classification when AI fails."""
@@ -0,0 +1,87 @@
+"""
+Article content processing.
+
+This module cleans raw feed content into plain text and scans it for
+category keywords ahead of classification.
+"""
+
+from typing import Dict, List, Any
+import logging
+
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    # Linear-time C++ regex engine; keyword alternations stay fast on long posts
+    import re2 as re
+except ImportError:
+    import re
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleProcessor:
+    """Cleans article content and extracts keyword signals."""
+    
+    def __init__(self, config):
+        self.config = config
+        # Keyword patterns are compiled once per category, not per article
+        self._keyword_patterns = {
+            category_id: re.compile(
+                r'\b(' + '|'.join(re.escape(keyword) for keyword in category.keywords) + r')\b',
+                re.IGNORECASE
+            )
+            for category_id, category in config.categories.items()
+            if category.keywords
+        }
+    
+    async def process_batch(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Clean and annotate a batch of articles.
+        
+        Args:
+            articles: List of raw article data
+        
+        Returns:
+            List of articles with plain-text content and keyword matches
+        """
+        processed_articles = []
+        
+        for article in articles:
+            try:
+                processed_articles.append(self.process_article(article))
+            except Exception as e:
+                logger.error(f"Processing failed for article {article.get('id', 'unknown')}: {e}")
+        
+        return processed_articles
+    
+    def process_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Clean a single article's content and scan it for category keywords.
+        
+        Args:
+            article: Raw article data
+        
+        Returns:
+            The article with cleaned text fields and keyword matches added
+        """
+        summary = self._strip_html(article.get('summary', ''))
+        content = self._strip_html(article.get('content', '')) or summary
+        
+        article['summary'] = summary
+        article['content'] = content
+        article['word_count'] = len(content.split())
+        
+        text = f"{article.get('title', '')} {content}"
+        article['keyword_matches'] = {
+            category_id: sorted({match.lower() for match in pattern.findall(text)})
+            for category_id, pattern in self._keyword_patterns.items()
+        }
+        
+        return article
+    
+    def _strip_html(self, html: str) -> str:
+        """Convert an HTML fragment to whitespace-normalized plain text."""
+        if not html:
+            return ''
+        text = LexborHTMLParser(html).text(separator=' ')
+        return ' '.join(text.split())
@@ -5,15 +5,28 @@ This module handles discovery, validation, and processing of RSS feeds
 from developer blogs.
 """
 
-from typing import List, Dict, Any
+from typing import AsyncIterator, List, Dict, Any, Optional
 import asyncio
+import aiohttp
+import fastfeedparser
 import feedparser
-import requests
 import logging
-from datetime import datetime
+from contextlib import aclosing
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from lxml import etree
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Separate connect/read bounds so one slow feed cannot hold a connection slot
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_read=15)
+VALIDATION_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5, sock_read=10)
+
+READ_CHUNK_BYTES = 64 * 1024
+
 
 class FeedManager:
     """Manages RSS feed discovery, validation, and ingestion."""
@@ -21,29 +34,156 @@ class FeedManager:
     def __init__(self, config):
         self.config = config
         self.active_feeds = config.get_active_feeds()
+        self.max_feed_bytes = config.app_config['processing']['max_feed_bytes']
+        self.max_pending_feeds = config.app_config['processing']['max_pending_feeds']
+        self._session = None
+        self._feed_state_path = Path("data/feed_state.json")
+        self._feed_state: Dict[str, Dict[str, str]] = self._load_feed_state()
+        # New validators are held back until every article of their feed is saved,
+        # so a failed run refetches the feed instead of getting a 304
+        self._pending_feed_state: Dict[str, Dict[str, str]] = {}
+        self._unsaved_counts: Dict[str, int] = {}
+    
+    def _load_feed_state(self) -> Dict[str, Dict[str, str]]:
+        """Load per-feed ETag/Last-Modified validators from disk."""
+        if not self._feed_state_path.exists():
+            return {}
+        try:
+            return orjson.loads(self._feed_state_path.read_bytes())
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Ignoring unreadable feed state file: {e}")
+            return {}
+    
+    def _save_feed_state(self):
+        """Persist per-feed ETag/Last-Modified validators to disk."""
+        self._feed_state_path.parent.mkdir(parents=True, exist_ok=True)
+        self._feed_state_path.write_bytes(orjson.dumps(self._feed_state))
+    
+    def mark_articles_saved(self, articles: List[Dict[str, Any]]):
+        """
+        Record that articles have been durably handled by the caller.
+        
+        Once every article fetched from a feed has been marked, that feed's
+        new ETag/Last-Modified validators are committed and written to disk.
         
-    async def fetch_all_feeds(self) -> List[Dict[str, Any]]:
+        Args:
+            articles: Articles that were saved, or deliberately skipped
         """
-        Fetch articles from all active RSS feeds.
+        committed = False
+        for article in articles:
+            feed_id = article['source_feed']
+            if feed_id not in self._unsaved_counts:
+                continue
+            self._unsaved_counts[feed_id] -= 1
+            if self._unsaved_counts[feed_id] <= 0:
+                self._commit_feed_state(feed_id)
+                committed = True
         
-        Returns:
-            List of raw article data from all feeds
+        if committed:
+            self._save_feed_state()
+    
+    def _commit_feed_state(self, feed_id: str):
+        """Promote a feed's pending validators to its saved state."""
+        self._unsaved_counts.pop(feed_id, None)
+        new_state = self._pending_feed_state.pop(feed_id, {})
+        if new_state:
+            self._feed_state[feed_id] = new_state
+        else:
+            self._feed_state.pop(feed_id, None)
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        # The session must be created inside a running event loop, so it is
+        # built lazily and reused for every fetch to keep connections alive.
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+    async def iter_all_feeds(self) -> AsyncIterator[Dict[str, Any]]:
         """
-        all_articles = []
+        Fetch all active RSS feeds, yielding articles as each feed completes.
         
-        tasks = [self.fetch_feed(feed) for feed in self.active_feeds]
-        feed_results = await asyncio.gather(*tasks, return_exceptions=True)
+        Fetches run as background tasks, so they keep progressing while the
+        caller works on articles that have already been yielded. At most
+        max_pending_feeds feeds are fetching or waiting to be consumed at
+        once, and each feed's task is dropped as soon as it is consumed, so
+        a slow consumer bounds how many articles are held in memory.
         
-        for feed, result in zip(self.active_feeds, feed_results):
-            if isinstance(result, Exception):
-                logger.error(f"Feed fetch failed for {feed.name}: {result}")
-                continue
+        Yields:
+            Raw article data, in feed completion order
+        """
+        remaining_feeds = iter(self.active_feeds)
+        pending = set()
+        done = set()
+        
+        def start_fetches():
+            # Finished but unconsumed feeds count against the limit too
+            while len(pending) + len(done) < self.max_pending_feeds:
+                feed = next(remaining_feeds, None)
+                if feed is None:
+                    return
+                pending.add(asyncio.create_task(self.fetch_feed(feed)))
+        
+        try:
+            start_fetches()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 
-            articles = result
-            logger.info(f"Fetched {len(articles)} articles from {feed.name}")
-            all_articles.extend(articles)
+                while done:
+                    # Drop each task as it is consumed; it holds its feed's articles
+                    task = done.pop()
+                    # Its slot is free, so keep fetching while the caller works
+                    start_fetches()
+                    error = task.exception()
+                    articles = task.result() if error is None else []
+                    del task
+                    if error is not None:
+                        # fetch_feed has already logged which feed failed
+                        logger.debug(f"Skipping failed feed: {error}")
+                    
+                    for article in articles:
+                        yield article
+                    del articles
+            
+            # Feeds that returned no articles have nothing left to wait for
+            self._save_feed_state()
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def iter_feed_chunks(self, size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Fetch all active RSS feeds, yielding articles in chunks as feeds complete.
+        
+        Args:
+            size: Number of articles per chunk
+            
+        Yields:
+            Lists of at most ``size`` raw articles
+        """
+        chunk = []
         
-        return all_articles
+        async with aclosing(self.iter_all_feeds()) as articles:
+            async for article in articles:
+                chunk.append(article)
+                if len(chunk) >= size:
+                    yield chunk
+                    chunk = []
+        
+        if chunk:
+            yield chunk
     
     async def fetch_feed(self, feed_config) -> List[Dict[str, Any]]:
         """
@@ -56,13 +196,26 @@ class FeedManager:
             List of article data from the feed
         """
         try:
-            # Use asyncio to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, requests.get, feed_config.url)
-            response.raise_for_status()
+            # Conditional GET so unchanged feeds come back as an empty 304
+            state = self._feed_state.get(feed_config.id, {})
+            headers = {}
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+            
+            session = self._get_session()
+            async with session.get(feed_config.url, headers=headers, timeout=FETCH_TIMEOUT) as response:
+                if response.status == 304:
+                    logger.debug(f"Feed {feed_config.name} not modified since last fetch")
+                    return []
+                response.raise_for_status()
+                body = await self._read_body(response)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
             
             # Parse RSS feed
-            feed_data = feedparser.parse(response.content)
+            feed_data = self._parse_feed(body)
             
             articles = []
             for entry in feed_data.entries:
@@ -70,16 +223,28 @@ class FeedManager:
                     'id': self._generate_article_id(entry),
                     'title': entry.get('title', 'Untitled'),
                     'url': entry.get('link', ''),
-                    'summary': entry.get('summary', ''),
+                    'summary': self._get_entry_summary(entry),
                     'author': entry.get('author', ''),
                     'published_date': self._parse_date(entry.get('published')),
                     'source_feed': feed_config.id,
                     'source_name': feed_config.name,
-                    'tags': [tag.term for tag in entry.get('tags', [])],
-                    'raw_entry': entry
+                    'content': self._get_entry_content(entry),
+                    'tags': self._get_entry_tags(entry)
                 }
                 articles.append(article)
             
+            # Validators stay pending until the caller reports every article saved
+            new_state = {}
+            if etag:
+                new_state['etag'] = etag
+            if last_modified:
+                new_state['last_modified'] = last_modified
+            self._pending_feed_state[feed_config.id] = new_state
+            self._unsaved_counts[feed_config.id] = len(articles)
+            if not articles:
+                self._commit_feed_state(feed_config.id)
+            
+            logger.info(f"Fetched {len(articles)} articles from {feed_config.name}")
             return articles
             
         except Exception as e:
@@ -119,15 +284,17 @@ class FeedManager:
             List of validated feeds suitable for inclusion
         """
         validated_feeds = []
+        session = self._get_session()
         
         for candidate in feed_candidates:
             try:
                 # Test feed accessibility
-                response = requests.get(candidate['url'], timeout=10)
-                response.raise_for_status()
+                async with session.get(candidate['url'], timeout=VALIDATION_TIMEOUT) as response:
+                    response.raise_for_status()
+                    body = await self._read_body(response)
                 
                 # Parse and validate feed structure
-                feed_data = feedparser.parse(response.content)
+                feed_data = self._parse_feed(body)
                 
                 if len(feed_data.entries) > 0:
                     # Basic quality checks passed
@@ -138,18 +305,82 @@ class FeedManager:
         
         return validated_feeds
     
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """Read a feed body, rejecting it once it exceeds max_feed_bytes."""
+        # Content-Length is the size on the wire; with a Content-Encoding
+        # it says nothing about the decompressed body
+        encoding = response.headers.get('Content-Encoding', 'identity').lower()
+        if response.content_length is not None and encoding == 'identity':
+            if response.content_length > self.max_feed_bytes:
+                raise ValueError(f"Feed too large: {response.content_length} bytes")
+            # Known uncompressed length: read straight into a single buffer
+            return await response.read()
+        
+        # Compressed or chunked body: enforce the limit on decompressed bytes
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_BYTES):
+            size += len(chunk)
+            if size > self.max_feed_bytes:
+                raise ValueError(f"Feed exceeded {self.max_feed_bytes} bytes")
+            chunks.append(chunk)
+        return b"".join(chunks)
+    
+    def _parse_feed(self, body: bytes):
+        """Parse a feed document, falling back to feedparser for malformed XML."""
+        try:
+            return fastfeedparser.parse(body)
+        except (etree.XMLSyntaxError, ValueError) as e:
+            # feedparser is slower but far more forgiving of broken markup
+            logger.debug(f"Falling back to feedparser for malformed feed: {e}")
+            return feedparser.parse(body)
+    
+    def _get_entry_content(self, entry) -> str:
+        """Extract the article body as a single string."""
+        content = entry.get('content')
+        if content:
+            return content[0].get('value', '')
+        return self._get_entry_summary(entry)
+    
+    def _get_entry_summary(self, entry) -> str:
+        """Extract the entry summary from either parser."""
+        # fastfeedparser stores the summary under 'description', feedparser under 'summary'
+        return entry.get('summary') or entry.get('description', '')
+    
+    def _get_entry_tags(self, entry) -> List[str]:
+        """Extract tag terms from an entry from either parser."""
+        tags = []
+        for tag in entry.get('tags') or []:
+            term = tag.get('term') if isinstance(tag, dict) else tag
+            if term:
+                tags.append(term)
+        return tags
+    
     def _generate_article_id(self, entry) -> str:
         """Generate a unique ID for an article."""
         # Use URL or GUID if available, otherwise create from title + date
         return entry.get('id', entry.get('link', f"{entry.get('title', '')}_{entry.get('published', '')}"))
     
-    def _parse_date(self, date_string) -> datetime:
-        """Parse date string from RSS entry."""
+    def _parse_date(self, date_string) -> Optional[datetime]:
+        """
+        Parse an entry's published date into an aware UTC datetime.
+        
+        fastfeedparser provides ISO 8601 strings, feedparser the raw RFC 822
+        value. Dates without an offset are taken to be UTC. Returns None when
+        the date is missing or unparseable, so undated articles stay distinct.
+        """
         if not date_string:
-            return datetime.now()
+            return None
         
         try:
-            # feedparser usually provides parsed date
-            return datetime.now()  # Placeholder
-        except:
-            return datetime.now()
\ No newline at end of file
+            parsed = datetime.fromisoformat(date_string)
+        except (TypeError, ValueError):
+            try:
+                parsed = parsedate_to_datetime(date_string)
+            except (TypeError, ValueError):
+                logger.debug(f"Unparseable entry date: {date_string!r}")
+                return None
+        
+        if parsed.tzinfo is None:
+            return parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc)
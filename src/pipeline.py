@@ -8,8 +8,11 @@ from typing import List, Dict, Any
 from datetime import datetime, timedelta
 import asyncio
 import logging
+from contextlib import aclosing
 from pathlib import Path
 
+import orjson
+
 from src.feeds.feed_manager import FeedManager
 from src.content.article_processor import ArticleProcessor
 from src.classification.copilot_classifier import CopilotClassifier
@@ -30,32 +33,67 @@ class SpelunkerPipeline:
         self.classifier = CopilotClassifier(self.config)
         self.ranker = ArticleRanker(self.config)
         self.list_generator = ListGenerator(self.config)
+        self._seen_ids_path = Path("data/seen_ids.txt")
+        self._seen_ids = self._load_seen_ids()
         
     async def run_daily_ingestion(self) -> Dict[str, Any]:
         """Run the daily feed ingestion pipeline."""
         logger.info("Starting daily ingestion pipeline")
         
         try:
-            # 1. Fetch and parse RSS feeds
-            raw_articles = await self.feed_manager.fetch_all_feeds()
-            logger.info(f"Fetched {len(raw_articles)} articles from feeds")
+            today = datetime.now().strftime("%Y-%m-%d")
+            batch_size = self.config.app_config['processing']['batch_size']
+            rate_limit = self.config.app_config['copilot']['rate_limit']
+            fetched_count = 0
+            classified_count = 0
+            batch_ids = set()
+            # Maps each in-flight chunk task to its article count
+            pending: Dict[asyncio.Task, int] = {}
             
-            # 2. Process article content
-            processed_articles = await self.article_processor.process_batch(raw_articles)
-            logger.info(f"Processed {len(processed_articles)} articles")
+            try:
+                # Chunks are processed as feeds complete, with enough of them in
+                # flight to keep up to rate_limit articles classifying at once
+                async with aclosing(self.feed_manager.iter_feed_chunks(size=batch_size)) as chunks:
+                    async for chunk in chunks:
+                        fetched_count += len(chunk)
+                        
+                        # 1. Skip articles already classified on a previous run or
+                        # repeated across syndicated feeds in this one
+                        new_articles = []
+                        skipped_articles = []
+                        for article in chunk:
+                            if article['id'] in self._seen_ids or article['id'] in batch_ids:
+                                skipped_articles.append(article)
+                                continue
+                            batch_ids.add(article['id'])
+                            new_articles.append(article)
+                        self.feed_manager.mark_articles_saved(skipped_articles)
+                        if not new_articles:
+                            continue
+                        
+                        while pending and sum(pending.values()) + len(new_articles) > rate_limit:
+                            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                            for task in done:
+                                del pending[task]
+                                classified_count += task.result()
+                        
+                        task = asyncio.create_task(self._ingest_chunk(today, new_articles))
+                        pending[task] = len(new_articles)
+                
+                for count in await asyncio.gather(*pending):
+                    classified_count += count
+            except BaseException:
+                # Let chunks already in flight finish saving before failing the run
+                await asyncio.gather(*pending, return_exceptions=True)
+                raise
             
-            # 3. Classify articles using Copilot
-            classified_articles = await self.classifier.classify_batch(processed_articles)
-            logger.info(f"Classified {len(classified_articles)} articles")
-            
-            # 4. Save daily data
-            today = datetime.now().strftime("%Y-%m-%d")
-            await self._save_daily_data(today, classified_articles)
+            logger.info(f"Fetched {fetched_count} articles from feeds")
+            logger.info(f"Classified {classified_count} new articles")
             
             return {
                 "status": "success",
                 "date": today,
-                "articles_processed": len(classified_articles),
+                "articles_processed": classified_count,
                 "feeds_checked": len(self.feed_manager.active_feeds)
             }
             
@@ -122,44 +160,114 @@ class SpelunkerPipeline:
             logger.error(f"Feed discovery failed: {e}")
             return {"status": "error", "error": str(e)}
     
-    async def _save_daily_data(self, date: str, articles: List[Dict[str, Any]]):
-        """Save daily ingestion data."""
+    async def aclose(self):
+        """Release network resources held by pipeline components."""
+        await self.feed_manager.aclose()
+        await self.classifier.aclose()
+    
+    async def _ingest_chunk(self, date: str, articles: List[Dict[str, Any]]) -> int:
+        """Process, classify and append one chunk of new articles."""
+        # 2. Process article content
+        processed_articles = await self.article_processor.process_batch(articles)
+        
+        # 3. Classify articles using Copilot
+        classified_articles = await self.classifier.classify_batch(processed_articles)
+        
+        # 4. Append to daily data
+        await self._append_daily_data(date, classified_articles)
+        self._record_seen_ids(classified_articles)
+        self.feed_manager.mark_articles_saved(
+            [a for a in classified_articles if 'classification_error' not in a]
+        )
+        
+        return len(classified_articles)
+    
+    def _load_seen_ids(self) -> set:
+        """Load the IDs of articles processed on previous runs."""
+        if not self._seen_ids_path.exists():
+            return set()
+        with open(self._seen_ids_path, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+    
+    def _record_seen_ids(self, articles: List[Dict[str, Any]]):
+        """Remember successfully classified article IDs so later runs skip them."""
+        # Articles left on the fallback score are retried on the next run
+        new_ids = [
+            a['id'] for a in articles
+            if 'classification_error' not in a and a['id'] not in self._seen_ids
+        ]
+        if not new_ids:
+            return
+        
+        self._seen_ids.update(new_ids)
+        self._seen_ids_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._seen_ids_path, 'a', encoding='utf-8') as f:
+            f.write("".join(f"{article_id}\n" for article_id in new_ids))
+    
+    async def _append_daily_data(self, date: str, articles: List[Dict[str, Any]]):
+        """Append classified articles to the day's JSON-lines file."""
         data_dir = Path("data/classified")
         data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Implementation would save to JSON files
-        # This is a placeholder for the actual implementation
-        pass
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC | orjson.OPT_APPEND_NEWLINE
+        with open(data_dir / f"{date}.jsonl", 'ab') as f:
+            f.write(b"".join(orjson.dumps(article, option=option) for article in articles))
     
     async def _load_weekly_articles(self, week: str) -> List[Dict[str, Any]]:
         """Load a week's worth of classified articles."""
-        # Implementation would load from daily JSON files
-        # This is a placeholder for the actual implementation
-        return []
+        data_dir = Path("data/classified")
+        if not data_dir.exists():
+            return []
+        
+        # Keyed by ID so an article retried after a failed classification
+        # replaces its earlier fallback-scored line
+        articles = {}
+        for path in sorted(data_dir.glob("*.jsonl")):
+            try:
+                day = datetime.strptime(path.stem, "%Y-%m-%d")
+            except ValueError:
+                continue
+            if day.strftime("%Y-W%U") != week:
+                continue
+            with open(path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        article = orjson.loads(line)
+                        articles[article['id']] = article
+        
+        return list(articles.values())
     
     async def _save_weekly_curation(self, week: str, reading_lists: Dict[str, List[Dict[str, Any]]]):
         """Save weekly curation results."""
         data_dir = Path("data/curated/weekly")
         data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Implementation would save reading lists
-        # This is a placeholder for the actual implementation
-        pass
+        (data_dir / f"{week}.json").write_bytes(
+            orjson.dumps(reading_lists, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC)
+        )
 
 
 async def main():
     """Main entry point for the pipeline."""
     pipeline = SpelunkerPipeline()
     
-    # Run daily ingestion
-    result = await pipeline.run_daily_ingestion()
-    print(f"Daily ingestion result: {result}")
-    
-    # Run weekly curation (if it's Monday)
-    if datetime.now().weekday() == 0:  # Monday
-        curation_result = await pipeline.run_weekly_curation()
-        print(f"Weekly curation result: {curation_result}")
+    try:
+        # Run daily ingestion
+        result = await pipeline.run_daily_ingestion()
+        print(f"Daily ingestion result: {result}")
+        
+        # Run weekly curation (if it's Monday)
+        if datetime.now().weekday() == 0:  # Monday
+            curation_result = await pipeline.run_weekly_curation()
+            print(f"Weekly curation result: {curation_result}")
+    finally:
+        await pipeline.aclose()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
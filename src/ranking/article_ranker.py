@@ -0,0 +1,142 @@
+"""
+Multi-factor article ranking.
+
+This module scores classified articles by combining category relevance,
+recency, feed authority, and engagement into a single final score.
+"""
+
+from typing import Dict, List, Any
+import logging
+from datetime import datetime, timezone
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Final Score = (Relevance × 0.4) + (Recency × 0.3) + (Authority × 0.2) + (Engagement × 0.1)
+RELEVANCE_WEIGHT = 0.4
+RECENCY_WEIGHT = 0.3
+AUTHORITY_WEIGHT = 0.2
+ENGAGEMENT_WEIGHT = 0.1
+
+# Recency score halves for every week of article age
+RECENCY_HALF_LIFE_DAYS = 7.0
+
+
+class ArticleRanker:
+    """Ranks articles using vectorized multi-factor scoring."""
+    
+    def __init__(self, config):
+        self.config = config
+        self._cat_index = {category_id: i for i, category_id in enumerate(config.categories)}
+        self._category_weights = np.array(
+            [category.weight for category in config.categories.values()],
+            dtype=np.float32
+        )
+    
+    async def rank_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Score and sort articles by final score.
+        
+        Args:
+            articles: List of classified articles with category scores
+        
+        Returns:
+            Articles with added final scores, highest first
+        """
+        if not articles:
+            return []
+        
+        final_scores = self._score(articles)
+        
+        ranked_articles = []
+        for i in np.argsort(-final_scores, kind='stable'):
+            article = articles[i]
+            article['final_score'] = float(final_scores[i])
+            ranked_articles.append(article)
+        
+        return ranked_articles
+    
+    def top_k_by_category(self, articles: List[Dict[str, Any]], k: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Select the k most relevant articles for each category.
+        
+        Args:
+            articles: List of classified articles with category scores
+            k: Maximum number of articles per category
+        
+        Returns:
+            Dictionary mapping category IDs to their top articles, highest first
+        """
+        if not articles or k <= 0:
+            return {category_id: [] for category_id in self._cat_index}
+        
+        relevance = self._vectorize(articles)
+        k = min(k, len(articles))
+        
+        top_articles = {}
+        for category_id, j in self._cat_index.items():
+            column = relevance[:, j]
+            # partition finds the k-th best score in linear time; ties at that
+            # cutoff go to the earliest articles so results are deterministic
+            cutoff = -np.partition(-column, k - 1)[k - 1]
+            above = np.flatnonzero(column > cutoff)
+            at_cutoff = np.flatnonzero(column == cutoff)[:k - len(above)]
+            candidates = np.concatenate((above, at_cutoff))
+            # Only the k candidates are sorted: by score, then original order
+            candidates = candidates[np.lexsort((candidates, -column[candidates]))]
+            top_articles[category_id] = [articles[i] for i in candidates if column[i] > 0]
+        
+        return top_articles
+    
+    def _score(self, articles: List[Dict[str, Any]]) -> np.ndarray:
+        """Compute final scores (0-100) for all articles at once."""
+        relevance = self._vectorize(articles) @ self._category_weights
+        total_weight = float(self._category_weights.sum())
+        if total_weight > 0:
+            relevance /= total_weight
+        
+        now = datetime.now(timezone.utc)
+        recency = np.empty(len(articles), dtype=np.float32)
+        authority = np.empty(len(articles), dtype=np.float32)
+        engagement = np.empty(len(articles), dtype=np.float32)
+        
+        for i, article in enumerate(articles):
+            recency[i] = self._age_days(article.get('published_date'), now)
+            feed = self.config.get_feed_by_id(article.get('source_feed'))
+            authority[i] = feed.authority_score if feed else 0.0
+            engagement[i] = article.get('engagement_score', 0.0)
+        
+        # Undated articles have infinite age and so get no recency credit
+        recency = 100.0 * np.exp2(-recency / RECENCY_HALF_LIFE_DAYS)
+        
+        return (
+            RELEVANCE_WEIGHT * relevance
+            + RECENCY_WEIGHT * recency
+            + AUTHORITY_WEIGHT * authority
+            + ENGAGEMENT_WEIGHT * engagement
+        )
+    
+    def _vectorize(self, articles: List[Dict[str, Any]]) -> np.ndarray:
+        """Stack article category scores into an (articles, categories) matrix."""
+        matrix = np.zeros((len(articles), len(self._cat_index)), dtype=np.float32)
+        for i, article in enumerate(articles):
+            for category_id, score in article.get('category_scores', {}).items():
+                j = self._cat_index.get(category_id)
+                if j is not None:
+                    matrix[i, j] = score
+        return matrix
+    
+    def _age_days(self, published_date, now: datetime) -> float:
+        """Get an article's age in days from a datetime or ISO string, or inf if unknown."""
+        if isinstance(published_date, str):
+            try:
+                published_date = datetime.fromisoformat(published_date)
+            except ValueError:
+                return np.inf
+        if not isinstance(published_date, datetime):
+            return np.inf
+        if published_date.tzinfo is None:
+            # Published dates are stored in UTC
+            published_date = published_date.replace(tzinfo=timezone.utc)
+        return max((now - published_date).total_seconds() / 86400.0, 0.0)
@@ -1,14 +1,23 @@
 """Configuration manager for the Dev Blog Spelunker."""
 
 import os
+import pickle
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
-@dataclass
+# Bump when the structure of cached config data changes
+CONFIG_CACHE_VERSION = 1
+
+
+@dataclass(slots=True, frozen=True)
 class CategoryConfig:
     """Configuration for a content category."""
     name: str
@@ -19,7 +28,7 @@ class CategoryConfig:
     classification_prompts: List[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedConfig:
     """Configuration for an RSS feed."""
     id: str
@@ -29,7 +38,7 @@ class FeedConfig:
     authority_score: float
     category_hints: List[str]
     tags: List[str]
-    last_checked: datetime = None
+    last_checked: Optional[datetime] = None
     status: str = "active"
 
 
@@ -40,6 +49,16 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self._categories = None
         self._feeds = None
+        self._feeds_by_id = None
+        self._active_feeds = None
+        self._app_config = None
+    
+    def reload(self):
+        """Drop loaded configuration so it is re-read on next access."""
+        self._categories = None
+        self._feeds = None
+        self._feeds_by_id = None
+        self._active_feeds = None
         self._app_config = None
     
     @property
@@ -63,11 +82,37 @@ class ConfigManager:
             self._load_app_config()
         return self._app_config
     
+    def _cached_load(self, path: Path) -> Any:
+        """Load a YAML file, reusing a pickled copy while the file is unchanged."""
+        cache_path = self.config_dir / ".cache" / f"{path.stem}.pkl"
+        
+        try:
+            if cache_path.stat().st_mtime_ns > path.stat().st_mtime_ns:
+                with open(cache_path, 'rb') as f:
+                    version, data = pickle.load(f)
+                if version == CONFIG_CACHE_VERSION:
+                    return data
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+            pass
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((CONFIG_CACHE_VERSION, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # A read-only config directory just means no cache
+            pass
+        
+        return data
+    
     def _load_categories(self):
         """Load category configurations from YAML."""
-        categories_file = self.config_dir / "categories.yaml"
-        with open(categories_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = self._cached_load(self.config_dir / "categories.yaml")
         
         self._categories = {}
         for category_id, config in data['categories'].items():
@@ -82,9 +127,7 @@ class ConfigManager:
     
     def _load_feeds(self):
         """Load feed configurations from YAML."""
-        feeds_file = self.config_dir / "feeds.yaml"
-        with open(feeds_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        data = self._cached_load(self.config_dir / "feeds.yaml")
         
         self._feeds = []
         for feed_config in data['feeds']:
@@ -98,6 +141,9 @@ class ConfigManager:
                 tags=feed_config['tags'],
                 status=feed_config.get('status', 'active')
             ))
+        
+        self._feeds_by_id = {f.id: f for f in self._feeds}
+        self._active_feeds = [f for f in self._feeds if f.status == 'active']
     
     def _load_app_config(self):
         """Load application configuration."""
@@ -115,7 +161,11 @@ class ConfigManager:
             'processing': {
                 'batch_size': 10,
                 'max_retries': 3,
-                'timeout': 30
+                'timeout': 30,
+                # Largest feed body accepted; bigger feeds are skipped with an error
+                'max_feed_bytes': int(os.getenv('FEED_MAX_BYTES', str(256 * 1024 * 1024))),
+                # Feeds fetching or awaiting processing at once; bounds fetched-article memory
+                'max_pending_feeds': int(os.getenv('FEED_MAX_PENDING', '50'))
             }
         }
     
@@ -125,8 +175,12 @@ class ConfigManager:
     
     def get_feed_by_id(self, feed_id: str) -> FeedConfig:
         """Get a specific feed configuration."""
-        return next((f for f in self.feeds if f.id == feed_id), None)
+        if self._feeds_by_id is None:
+            self._load_feeds()
+        return self._feeds_by_id.get(feed_id)
     
     def get_active_feeds(self) -> List[FeedConfig]:
         """Get all active feeds."""
-        return [f for f in self.feeds if f.status == 'active']
\ No newline at end of file
+        if self._active_feeds is None:
+            self._load_feeds()
+        return self._active_feeds
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""Tests for ArticleProcessor content cleaning."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.content.article_processor import ArticleProcessor
+
+
+@pytest.fixture
+def processor():
+    config = SimpleNamespace(categories={
+        'technical_excellence': SimpleNamespace(keywords=['performance', 'system design']),
+        'communication_collaboration': SimpleNamespace(keywords=['leadership']),
+        'career_growth': SimpleNamespace(keywords=[]),
+    })
+    return ArticleProcessor(config)
+
+
+@pytest.mark.asyncio
+async def test_process_batch_strips_html_and_matches_keywords(processor):
+    article = {
+        'id': 'a1',
+        'title': 'System Design notes',
+        'summary': '<p>Short <em>summary</em></p>',
+        'content': '<p>On <b>performance</b>\n and   leadership</p>'
+    }
+
+    [processed] = await processor.process_batch([article])
+
+    assert processed['summary'] == 'Short summary'
+    assert processed['content'] == 'On performance and leadership'
+    assert processed['word_count'] == 4
+    assert processed['keyword_matches'] == {
+        'technical_excellence': ['performance', 'system design'],
+        'communication_collaboration': ['leadership'],
+    }
@@ -0,0 +1,126 @@
+"""Tests for ArticleRanker scoring and selection."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.ranking.article_ranker import ArticleRanker
+
+
+@pytest.fixture
+def ranker():
+    feeds = {
+        'big': SimpleNamespace(authority_score=90.0),
+        'small': SimpleNamespace(authority_score=10.0),
+    }
+    config = SimpleNamespace(
+        categories={
+            'tech': SimpleNamespace(weight=1.0),
+            'career': SimpleNamespace(weight=1.0),
+        },
+        get_feed_by_id=feeds.get
+    )
+    return ArticleRanker(config)
+
+
+def make_article(article_id, scores, days_old=0, source_feed='small'):
+    published = datetime.now(timezone.utc) - timedelta(days=days_old)
+    return {
+        'id': article_id,
+        'category_scores': scores,
+        'published_date': published.isoformat(),
+        'source_feed': source_feed,
+    }
+
+
+@pytest.mark.asyncio
+async def test_rank_articles_orders_by_final_score(ranker):
+    articles = [
+        make_article('low', {'tech': 10.0}),
+        make_article('high', {'tech': 90.0, 'career': 60.0}),
+        make_article('mid', {'tech': 50.0}),
+    ]
+
+    ranked = await ranker.rank_articles(articles)
+
+    assert [a['id'] for a in ranked] == ['high', 'mid', 'low']
+    assert ranked[0]['final_score'] > ranked[1]['final_score'] > ranked[2]['final_score']
+
+
+@pytest.mark.asyncio
+async def test_rank_articles_prefers_recent_and_authoritative(ranker):
+    articles = [
+        make_article('old', {'tech': 50.0}, days_old=28),
+        make_article('new', {'tech': 50.0}, days_old=0),
+        make_article('authoritative', {'tech': 50.0}, days_old=0, source_feed='big'),
+    ]
+
+    ranked = await ranker.rank_articles(articles)
+
+    assert [a['id'] for a in ranked] == ['authoritative', 'new', 'old']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("published_date", [None, "not a date", 12345], ids=["missing", "unparseable", "non-date"])
+async def test_rank_articles_treats_unknown_dates_as_oldest(ranker, published_date):
+    undated = make_article('undated', {'tech': 50.0})
+    undated['published_date'] = published_date
+    articles = [undated, make_article('month-old', {'tech': 50.0}, days_old=30)]
+
+    ranked = await ranker.rank_articles(articles)
+
+    assert [a['id'] for a in ranked] == ['month-old', 'undated']
+
+
+@pytest.mark.asyncio
+async def test_rank_articles_handles_naive_utc_dates(ranker):
+    naive = make_article('naive', {'tech': 50.0})
+    naive['published_date'] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+    aware = make_article('aware', {'tech': 50.0})
+
+    ranked = await ranker.rank_articles([naive, aware])
+
+    assert ranked[0]['final_score'] == pytest.approx(ranked[1]['final_score'], abs=0.01)
+
+
+def test_top_k_by_category_orders_and_breaks_ties_by_position(ranker):
+    articles = [
+        make_article('a', {'tech': 50.0}),
+        make_article('b', {'tech': 80.0}),
+        make_article('c', {'tech': 50.0}),
+        make_article('d', {'tech': 50.0}),
+    ]
+
+    top = ranker.top_k_by_category(articles, 3)
+
+    assert [a['id'] for a in top['tech']] == ['b', 'a', 'c']
+
+
+def test_top_k_by_category_with_k_larger_than_articles(ranker):
+    articles = [
+        make_article('a', {'tech': 20.0, 'career': 70.0}),
+        make_article('b', {'tech': 40.0}),
+    ]
+
+    top = ranker.top_k_by_category(articles, 10)
+
+    assert [a['id'] for a in top['tech']] == ['b', 'a']
+    assert [a['id'] for a in top['career']] == ['a']
+
+
+def test_top_k_by_category_excludes_zero_scores(ranker):
+    articles = [
+        make_article('a', {'tech': 0.0}),
+        make_article('b', {}),
+        make_article('c', {'career': 30.0}),
+    ]
+
+    top = ranker.top_k_by_category(articles, 2)
+
+    assert top['tech'] == []
+    assert [a['id'] for a in top['career']] == ['c']
+
+
+def test_top_k_by_category_with_no_articles(ranker):
+    assert ranker.top_k_by_category([], 5) == {'tech': [], 'career': []}
@@ -0,0 +1,248 @@
+"""Tests for feed parsing in FeedManager."""
+
+import asyncio
+import gc
+import gzip
+import weakref
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.feeds.feed_manager import FeedManager
+
+RSS_SAMPLE = b"""<?xml version="1.0"?>
+<rss version="2.0">
+  <channel>
+    <title>Example RSS</title>
+    <link>https://example.com</link>
+    <description>Example feed</description>
+    <item>
+      <title>RSS Post</title>
+      <link>https://example.com/rss-post</link>
+      <guid>rss-1</guid>
+      <description>&lt;p&gt;RSS summary text&lt;/p&gt;</description>
+      <category>performance</category>
+    </item>
+  </channel>
+</rss>
+"""
+
+ATOM_SAMPLE = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example Atom</title>
+  <id>urn:example:atom</id>
+  <updated>2025-01-01T00:00:00Z</updated>
+  <entry>
+    <title>Atom Post</title>
+    <link href="https://example.com/atom-post"/>
+    <id>atom-1</id>
+    <updated>2025-01-01T00:00:00Z</updated>
+    <summary>Atom summary text</summary>
+    <category term="architecture"/>
+  </entry>
+</feed>
+"""
+
+
+@pytest.fixture
+def feed_manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    config = SimpleNamespace(
+        get_active_feeds=lambda: [],
+        app_config={'processing': {'max_feed_bytes': 1024 * 1024, 'max_pending_feeds': 4}}
+    )
+    return FeedManager(config)
+
+
+@pytest.mark.parametrize("body, expected_id, expected_summary, expected_tag", [
+    (RSS_SAMPLE, "rss-1", "RSS summary text", "performance"),
+    (ATOM_SAMPLE, "atom-1", "Atom summary text", "architecture"),
+], ids=["rss", "atom"])
+def test_parse_feed_extracts_summary_and_content(feed_manager, body, expected_id, expected_summary, expected_tag):
+    feed_data = feed_manager._parse_feed(body)
+
+    assert len(feed_data.entries) == 1
+    entry = feed_data.entries[0]
+
+    assert feed_manager._generate_article_id(entry) == expected_id
+    assert expected_summary in feed_manager._get_entry_summary(entry)
+    assert expected_summary in feed_manager._get_entry_content(entry)
+    assert feed_manager._get_entry_tags(entry) == [expected_tag]
+
+
+class FakeContent:
+    def __init__(self, body):
+        self._body = body
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self._body), size):
+            yield self._body[i:i + size]
+
+
+class FakeResponse:
+    def __init__(self, body, status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content_length = len(body)
+        self.content = FakeContent(body)
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        return self.response
+
+
+@pytest.mark.asyncio
+async def test_validators_are_saved_only_after_articles_are_saved(feed_manager, tmp_path):
+    feed = SimpleNamespace(id="example", name="Example", url="https://example.com/rss")
+    session = FakeSession(FakeResponse(RSS_SAMPLE, headers={'ETag': '"v1"'}))
+    feed_manager._get_session = lambda: session
+
+    articles = await feed_manager.fetch_feed(feed)
+
+    # Fetched but not yet saved: a rerun must not send the new ETag
+    assert "example" not in feed_manager._feed_state
+    assert not (tmp_path / "data" / "feed_state.json").exists()
+
+    feed_manager.mark_articles_saved(articles)
+
+    assert feed_manager._feed_state["example"] == {'etag': '"v1"'}
+    assert (tmp_path / "data" / "feed_state.json").exists()
+
+    await feed_manager.fetch_feed(feed)
+    assert session.requests[-1] == {'If-None-Match': '"v1"'}
+
+
+@pytest.mark.asyncio
+async def test_abandoned_run_does_not_save_validators(feed_manager, tmp_path):
+    feed_manager.active_feeds = [SimpleNamespace(id="example", name="Example", url="https://example.com/rss")]
+    feed_manager._get_session = lambda: FakeSession(FakeResponse(RSS_SAMPLE, headers={'ETag': '"v1"'}))
+
+    articles = feed_manager.iter_all_feeds()
+    await articles.__anext__()
+    # Simulates a later pipeline stage failing before anything was saved
+    await articles.aclose()
+
+    assert "example" not in feed_manager._feed_state
+    assert not (tmp_path / "data" / "feed_state.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_read_body_enforces_limit_without_content_length(feed_manager):
+    response = FakeResponse(RSS_SAMPLE)
+    response.content_length = None
+    assert await feed_manager._read_body(response) == RSS_SAMPLE
+
+    feed_manager.max_feed_bytes = len(RSS_SAMPLE) - 1
+    response = FakeResponse(RSS_SAMPLE)
+    response.content_length = None
+    with pytest.raises(ValueError):
+        await feed_manager._read_body(response)
+
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("2025-01-06T10:00:00+00:00", datetime(2025, 1, 6, 10, 0, tzinfo=timezone.utc)),
+    ("2025-01-06T12:00:00+02:00", datetime(2025, 1, 6, 10, 0, tzinfo=timezone.utc)),
+    ("2025-01-06T10:00:00", datetime(2025, 1, 6, 10, 0, tzinfo=timezone.utc)),
+    ("Mon, 06 Jan 2025 05:00:00 -0500", datetime(2025, 1, 6, 10, 0, tzinfo=timezone.utc)),
+    ("not a date", None),
+    (None, None),
+], ids=["iso-utc", "iso-offset", "iso-naive", "rfc822", "garbage", "missing"])
+def test_parse_date_returns_aware_utc(feed_manager, date_string, expected):
+    parsed = feed_manager._parse_date(date_string)
+
+    assert parsed == expected
+    if parsed is not None:
+        assert parsed.utcoffset() == timedelta(0)
+
+
+@pytest.mark.asyncio
+async def test_read_body_enforces_limit_on_decompressed_gzip_body(feed_manager):
+    # aiohttp reports the compressed Content-Length but yields decompressed bytes
+    body = b"<rss>" + b" " * (2 * 1024 * 1024) + b"</rss>"
+    response = FakeResponse(body, headers={'Content-Encoding': 'gzip'})
+    response.content_length = len(gzip.compress(body))
+    assert response.content_length < feed_manager.max_feed_bytes
+
+    async def unbounded_read():
+        raise AssertionError("compressed bodies must not take the unbounded read path")
+    response.read = unbounded_read
+
+    with pytest.raises(ValueError):
+        await feed_manager._read_body(response)
+
+
+class TrackedArticle(dict):
+    """Article dict that can be weakly referenced to check it was released."""
+
+
+def install_fake_fetches(feed_manager, feed_count, articles_per_feed, started=None):
+    feed_manager.active_feeds = [
+        SimpleNamespace(id=f"feed-{i}", name=f"Feed {i}", url="") for i in range(feed_count)
+    ]
+    refs = []
+
+    async def fetch_feed(feed):
+        if started is not None:
+            started.append(feed.id)
+        await asyncio.sleep(0)
+        articles = [TrackedArticle(id=f"{feed.id}-{j}", source_feed=feed.id) for j in range(articles_per_feed)]
+        refs.extend(weakref.ref(article) for article in articles)
+        return articles
+
+    feed_manager.fetch_feed = fetch_feed
+    return lambda: sum(1 for ref in refs if ref() is not None)
+
+
+@pytest.mark.asyncio
+async def test_consumed_feeds_are_released(feed_manager):
+    count_alive = install_fake_fetches(feed_manager, feed_count=20, articles_per_feed=10)
+
+    chunks = feed_manager.iter_feed_chunks(size=10)
+    for _ in range(19):
+        chunk = await chunks.__anext__()
+        # Simulate the pipeline annotating articles in place
+        for article in chunk:
+            article['content'] = 'x' * 1000
+        del chunk
+        gc.collect()
+
+    # Only unconsumed feeds (bounded by max_pending_feeds) may still be held
+    assert count_alive() <= (feed_manager.max_pending_feeds + 1) * 10
+    await chunks.aclose()
+
+
+@pytest.mark.asyncio
+async def test_fetches_are_bounded_by_max_pending_feeds(feed_manager):
+    started = []
+    install_fake_fetches(feed_manager, feed_count=20, articles_per_feed=10, started=started)
+    consumed = 0
+
+    async with aclosing(feed_manager.iter_feed_chunks(size=10)) as chunks:
+        async for chunk in chunks:
+            consumed += 1
+            # A slow consumer: let every started fetch finish before continuing
+            await asyncio.sleep(0.01)
+            assert len(started) - consumed <= feed_manager.max_pending_feeds
+
+    assert consumed == 20
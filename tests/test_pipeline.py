@@ -0,0 +1,213 @@
+"""Tests for chunked daily ingestion in SpelunkerPipeline."""
+
+import asyncio
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import orjson
+import pytest
+
+from tests.test_feed_manager import FakeResponse
+
+PIPELINE_PATH = Path(__file__).resolve().parent.parent / "src" / "pipeline.py"
+
+FEED_COUNT = 6
+ARTICLES_PER_FEED = 5
+
+CATEGORIES_YAML = """
+categories:
+  technical_excellence:
+    name: "Technical Excellence"
+    description: "Engineering practices"
+    weight: 1.0
+    keywords: ["performance"]
+    examples: []
+    classification_prompts: []
+"""
+
+
+def feed_url(i):
+    return f"https://example.com/feed-{i}.xml"
+
+
+def feed_body(i):
+    items = "".join(
+        f"<item><title>Post {j}</title><link>https://example.com/{i}/{j}</link>"
+        f"<guid>feed-{i}-{j}</guid><description>Body {j}</description></item>"
+        for j in range(ARTICLES_PER_FEED)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {i}</title>{items}</channel></rss>'.encode()
+
+
+class FeedSession:
+    """Serves a generated RSS feed with an ETag for each configured URL."""
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append((url, headers or {}))
+        i = int(url.rsplit("-", 1)[1].split(".")[0])
+        return FakeResponse(feed_body(i), headers={'ETag': f'"feed-{i}-v1"'})
+
+
+@pytest.fixture
+def pipeline_module(monkeypatch):
+    # src/pipeline/ shadows src/pipeline.py, and ListGenerator is not implemented yet
+    list_generator = types.ModuleType("src.curation.list_generator")
+    list_generator.ListGenerator = lambda config: None
+    monkeypatch.setitem(sys.modules, "src.curation.list_generator", list_generator)
+
+    spec = importlib.util.spec_from_file_location("spelunker_pipeline", PIPELINE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def pipeline(pipeline_module, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("COPILOT_RATE_LIMIT", "30")
+
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "categories.yaml").write_text(CATEGORIES_YAML)
+    feeds = "feeds:\n" + "".join(
+        f"""  - id: "feed-{i}"
+    name: "Feed {i}"
+    url: "{feed_url(i)}"
+    description: "Feed {i}"
+    authority_score: 50
+    category_hints: []
+    tags: []
+"""
+        for i in range(FEED_COUNT)
+    )
+    (config_dir / "feeds.yaml").write_text(feeds)
+
+    pipeline = pipeline_module.SpelunkerPipeline(str(config_dir))
+    pipeline.feed_manager._get_session = lambda session=FeedSession(): session
+    return pipeline
+
+
+class FakeCopilot:
+    """Stands in for the Copilot call and records how many run at once."""
+
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def classify_article(self, article):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            if article['id'] in self.fail_ids:
+                raise RuntimeError("copilot unavailable")
+            return {"technical_excellence": 80.0}
+        finally:
+            self.in_flight -= 1
+
+
+def written_articles():
+    path = next(Path("data/classified").glob("*.jsonl"), None)
+    if path is None:
+        return []
+    return [orjson.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
+
+
+def saved_feed_state():
+    path = Path("data/feed_state.json")
+    return orjson.loads(path.read_bytes()) if path.exists() else {}
+
+
+def seen_ids():
+    path = Path("data/seen_ids.txt")
+    return set(path.read_text().split()) if path.exists() else set()
+
+
+def fully_written_feeds(articles):
+    counts = {}
+    for article in articles:
+        counts[article['source_feed']] = counts.get(article['source_feed'], 0) + 1
+    return {feed_id for feed_id, count in counts.items() if count == ARTICLES_PER_FEED}
+
+
+@pytest.mark.asyncio
+async def test_daily_ingestion_classifies_beyond_one_chunk_at_a_time(pipeline):
+    copilot = FakeCopilot()
+    pipeline.classifier.classify_article = copilot.classify_article
+
+    result = await pipeline.run_daily_ingestion()
+
+    total = FEED_COUNT * ARTICLES_PER_FEED
+    assert result['status'] == 'success'
+    assert result['articles_processed'] == total
+    assert len(written_articles()) == total
+    assert len(seen_ids()) == total
+    assert set(saved_feed_state()) == {f"feed-{i}" for i in range(FEED_COUNT)}
+    # Several batch_size chunks classify together, but never above rate_limit
+    batch_size = pipeline.config.app_config['processing']['batch_size']
+    assert batch_size < copilot.max_in_flight <= pipeline.config.app_config['copilot']['rate_limit']
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_drains_in_flight_chunks_and_saves_only_complete_feeds(pipeline):
+    copilot = FakeCopilot()
+    pipeline.classifier.classify_article = copilot.classify_article
+    classify_batch = pipeline.classifier.classify_batch
+    calls = 0
+
+    async def failing_classify_batch(articles):
+        nonlocal calls
+        calls += 1
+        if calls == 3:
+            raise RuntimeError("classifier crashed")
+        return await classify_batch(articles)
+
+    pipeline.classifier.classify_batch = failing_classify_batch
+
+    result = await pipeline.run_daily_ingestion()
+
+    assert result['status'] == 'error'
+    assert result['error'] == "classifier crashed"
+    # The first two chunks were still classifying when the third failed
+    articles = written_articles()
+    assert len(articles) == 20
+    complete_feeds = fully_written_feeds(articles)
+    assert len(complete_feeds) == 4
+    assert set(saved_feed_state()) == complete_feeds
+    assert seen_ids() == {a['id'] for a in articles}
+
+
+@pytest.mark.asyncio
+async def test_fallback_classified_articles_are_retried(pipeline):
+    copilot = FakeCopilot(fail_ids={"feed-2-3"})
+    pipeline.classifier.classify_article = copilot.classify_article
+
+    result = await pipeline.run_daily_ingestion()
+
+    assert result['status'] == 'success'
+    fallback = [a for a in written_articles() if 'classification_error' in a]
+    assert [a['id'] for a in fallback] == ["feed-2-3"]
+    assert "feed-2-3" not in seen_ids()
+    # feed-2 keeps no validators, so the next run refetches it in full
+    assert set(saved_feed_state()) == {f"feed-{i}" for i in range(FEED_COUNT)} - {"feed-2"}
+
+
+@pytest.mark.asyncio
+async def test_skipped_articles_commit_their_feed_validators(pipeline):
+    already_seen = {f"feed-0-{j}" for j in range(ARTICLES_PER_FEED)}
+    pipeline._seen_ids.update(already_seen)
+    copilot = FakeCopilot()
+    pipeline.classifier.classify_article = copilot.classify_article
+
+    result = await pipeline.run_daily_ingestion()
+
+    assert result['status'] == 'success'
+    assert result['articles_processed'] == (FEED_COUNT - 1) * ARTICLES_PER_FEED
+    assert not already_seen & {a['id'] for a in written_articles()}
+    assert "feed-0" in saved_feed_state()